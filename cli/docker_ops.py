@@ -2,19 +2,104 @@
 
 from __future__ import annotations
 
-import shlex
+import functools
+import importlib
+import re
 import subprocess
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+import yaml
 
 from .exceptions import DockerError
 
+LOG_BUFFER_SIZE = 1 << 17
+# ``docker compose up --wait`` first shipped in Compose v2.1.1.
+COMPOSE_WAIT_MIN_VERSION = (2, 1, 1)
+
+
+def decode_output(data: Optional[bytes | str]) -> str:
+    """Decode captured process output lazily, at the point it is displayed."""
+    if data is None:
+        return ""
+    if isinstance(data, str):
+        return data
+    return data.decode("utf-8", errors="replace")
+
+
+@functools.lru_cache(maxsize=1)
+def docker_client() -> Optional[Any]:
+    """Return a shared Docker SDK client, or None when the SDK is not installed.
+
+    The SDK talks to the daemon socket directly instead of forking the docker CLI.
+    It is imported here, not at module level, so commands that never reach the
+    daemon do not load it (and requests/urllib3) on every start.
+    """
+    # Looked up dynamically: both mypy and the import system can resolve ``docker`` to
+    # the repo's docker/ template directory, which has no ``from_env``.
+    try:
+        docker_sdk = importlib.import_module("docker")
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    docker_from_env = getattr(docker_sdk, "from_env", None)
+    if docker_from_env is None:
+        return None
+    docker_errors = importlib.import_module("docker.errors")
+    try:
+        return docker_from_env()
+    except docker_errors.DockerException as exc:
+        raise DockerError(f"Unable to reach the Docker daemon: {exc}") from exc
+
+
+@functools.lru_cache(maxsize=None)
+def compose_version(compose_argv: tuple[str, ...]) -> tuple[bool, str]:
+    """Run ``<compose> version --short`` once per process and per compose binary.
+
+    Returns ``(True, version)`` on success, otherwise ``(False, reason)``.
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            [*compose_argv, "version", "--short"],
+            check=True,
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        return False, "command not found"
+    except OSError as exc:
+        return False, str(exc)
+    except subprocess.CalledProcessError as exc:
+        message = (
+            decode_output(exc.stderr).strip() or decode_output(exc.stdout).strip() or str(exc)
+        )
+        return False, message
+    return True, decode_output(result.stdout).strip() or "OK"
+
+
+def defines_healthchecks(compose_file: Path, services: Iterable[str]) -> bool:
+    """Whether every named service in a compose file declares a ``healthcheck``.
+
+    Without one, ``up --wait`` only waits for the container to be running.
+    """
+    try:
+        spec = yaml.safe_load(compose_file.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        return False
+    declared = spec.get("services") if isinstance(spec, dict) else None
+    if not isinstance(declared, dict):
+        return False
+    return all(
+        isinstance(declared.get(name), dict)
+        and isinstance(declared[name].get("healthcheck"), dict)
+        and not declared[name]["healthcheck"].get("disable", False)
+        for name in services
+    )
+
 
 class DockerRunner:
     """Thin wrapper that shells out to docker compose."""
 
-    def __init__(self, compose_bin: str) -> None:
-        self._compose_bin = shlex.split(compose_bin)
+    def __init__(self, compose_argv: Sequence[str]) -> None:
+        self._compose_bin = list(compose_argv)
 
     def compose(
         self,
@@ -23,25 +108,49 @@ class DockerRunner:
         *,
         check: bool = True,
         capture_output: bool = False,
-        text: bool = True,
+        text: bool = False,
         input_data: Optional[str] = None,
     ) -> subprocess.CompletedProcess:
         cmd = [*self._compose_bin, "-f", str(compose_file), *args]
+        payload: Optional[str | bytes] = input_data
+        if input_data is not None and not text:
+            payload = input_data.encode("utf-8")
         try:
             return subprocess.run(  # noqa: S603
                 cmd,
                 check=check,
                 capture_output=capture_output,
                 text=text,
-                input=input_data,
+                input=payload,
             )
         except subprocess.CalledProcessError as exc:  # pragma: no cover - plumbing
-            raise DockerError(f"Command failed: {' '.join(cmd)}\n{exc.stderr}") from exc
+            raise DockerError(
+                f"Command failed: {' '.join(cmd)}\n{decode_output(exc.stderr)}"
+            ) from exc
+
+    def supports_wait(self) -> bool:
+        """Whether this compose binary understands ``up --wait``."""
+        ok, output = compose_version(tuple(self._compose_bin))
+        match = re.search(r"(\d+)\.(\d+)\.(\d+)", output) if ok else None
+        if match is None:
+            return False
+        return tuple(int(part) for part in match.groups()) >= COMPOSE_WAIT_MIN_VERSION
 
-    def up(self, compose_file: Path, *, detach: bool = True) -> None:
+    def up(
+        self,
+        compose_file: Path,
+        *,
+        detach: bool = True,
+        wait: bool = False,
+        wait_timeout: Optional[int] = None,
+    ) -> None:
         args: List[str] = ["up"]
         if detach:
             args.append("-d")
+        if wait:
+            args.append("--wait")
+            if wait_timeout is not None:
+                args.extend(["--wait-timeout", str(wait_timeout)])
         self.compose(compose_file, args)
 
     def down(self, compose_file: Path, *, volumes: bool = True) -> None:
@@ -70,17 +179,23 @@ class DockerRunner:
             args,
             check=check,
             capture_output=True,
-            text=True,
             input_data=input_data,
         )
 
-    def logs(self, compose_file: Path, service: Optional[str] = None, *, tail: int = 100) -> str:
-        args = ["logs", "--tail", str(tail)]
+    def logs(
+        self, compose_file: Path, service: Optional[str] = None, *, tail: int = 100
+    ) -> Iterator[str]:
+        """Yield log lines as they arrive; ``"".join(...)`` for the full text."""
+        cmd = [*self._compose_bin, "-f", str(compose_file), "logs", "--tail", str(tail)]
         if service:
-            args.append(service)
-        result = self.compose(
-            compose_file,
-            args,
-            capture_output=True,
-        )
-        return result.stdout
+            cmd.append(service)
+        with subprocess.Popen(  # noqa: S603
+            cmd,
+            stdout=subprocess.PIPE,
+            bufsize=LOG_BUFFER_SIZE,
+        ) as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                yield line.decode("utf-8", errors="replace")
+        if proc.returncode != 0:
+            raise DockerError(f"Command failed: {' '.join(cmd)}")
@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict, dataclass
+import os
+import re
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 from .exceptions import ManifestError
 
+# Statuses are padded to a fixed width so they can be patched in place.
+STATUS_WIDTH = 10
+_STATUS_VALUE = re.compile(rb'"status":\s*"([^"]*)"')
+# History files are read and written whole; a large buffer cuts syscalls.
+IO_BUFFER_SIZE = 1 << 17
+
 
-@dataclass
+@dataclass(slots=True)
 class HistoryRecord:
     run_id: str
     edition: str
@@ -27,73 +36,176 @@ class HistoryRecord:
     status: str = "running"
     keep_alive: bool = False
 
-    def to_json(self) -> str:
+    def to_json(self) -> bytes:
+        """Serialise as one newline-terminated JSONL entry."""
         payload = asdict(self)
-        payload["compose_file"] = str(self.compose_file)
-        payload["run_root"] = str(self.run_root)
-        return json.dumps(payload)
+        payload["status"] = f"{self.status:<{STATUS_WIDTH}}"
+        return orjson.dumps(payload, default=str, option=orjson.OPT_APPEND_NEWLINE)
 
     @classmethod
     def from_dict(cls, data: dict) -> "HistoryRecord":
-        return cls(
-            run_id=data["run_id"],
-            edition=data["edition"],
-            version=data["version"],
-            db_name=data["db_name"],
-            compose_file=Path(data["compose_file"]),
-            run_root=Path(data["run_root"]),
-            http_port=int(data["http_port"]),
-            longpoll_port=int(data["longpoll_port"]),
-            pg_port=int(data["pg_port"]),
-            seed=data["seed"],
-            started_at=data["started_at"],
-            status=data.get("status", "running"),
-            keep_alive=bool(data.get("keep_alive", False)),
-        )
+        """Build from a parsed entry, ignoring keys this version does not know."""
+        fields = {key: value for key, value in data.items() if key in _RECORD_FIELDS}
+        fields["compose_file"] = Path(fields["compose_file"])
+        fields["run_root"] = Path(fields["run_root"])
+        for key in ("http_port", "longpoll_port", "pg_port"):
+            fields[key] = int(fields[key])
+        fields["status"] = fields.get("status", "running").rstrip()
+        fields["keep_alive"] = bool(fields.get("keep_alive", False))
+        return cls(**fields)
+
+
+_RECORD_FIELDS = frozenset(HistoryRecord.__dataclass_fields__)
+
+
+class HistoryStore:
+    """JSONL-backed run history with an in-memory index keyed by run id.
+
+    The file is only re-parsed when its modification time or size changes, so
+    repeated lookups within one process are dictionary hits. A ``.idx`` sidecar
+    maps run ids to line offsets so status changes patch a single line.
+    """
+
+    def __init__(self, history_path: Path) -> None:
+        self.history_path = history_path
+        self.index_path = history_path.with_name(history_path.name + ".idx")
+        self._by_id: Dict[str, HistoryRecord] = {}
+        self._offsets: Optional[Dict[str, int]] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+
+    def _current_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.history_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _refresh(self) -> None:
+        stamp = self._current_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
+        self._by_id = {}
+        self._offsets = None
+        if stamp is not None:
+            with self.history_path.open("rb", buffering=IO_BUFFER_SIZE) as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = HistoryRecord.from_dict(orjson.loads(line))
+                    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+                        continue  # unreadable or foreign entry; skip rather than fail every command
+                    self._by_id[record.run_id] = record
+        self._stamp = stamp
+
+    def records(self) -> List[HistoryRecord]:
+        self._refresh()
+        return list(self._by_id.values())
+
+    def find(self, run_id: str) -> HistoryRecord:
+        self._refresh()
+        try:
+            return self._by_id[run_id]
+        except KeyError:
+            raise ManifestError(f"Run id not found in history: {run_id}") from None
+
+    def append(self, record: HistoryRecord) -> None:
+        self._refresh()
+        self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.history_path.open("ab", buffering=IO_BUFFER_SIZE) as handle:
+            offset = handle.tell()
+            handle.write(record.to_json())
+        with self.index_path.open("ab") as index:
+            index.write(f"{record.run_id}\t{offset}\n".encode("utf-8"))
+        # Cache a copy: callers keep mutating their record after it is logged.
+        self._by_id[record.run_id] = replace(record)
+        if self._offsets is not None:
+            self._offsets[record.run_id] = offset
+        self._stamp = self._current_stamp()
+
+    def update_status(self, run_id: str, status: str) -> None:
+        self._refresh()
+        try:
+            record = self._by_id[run_id]
+        except KeyError:
+            raise ManifestError(f"Run id not found in history: {run_id}") from None
+        self._by_id[run_id] = replace(record, status=status)
+        if not self._patch_status(run_id, status):
+            self._rewrite()
+        self._stamp = self._current_stamp()
+
+    def _load_offsets(self) -> Dict[str, int]:
+        if self._offsets is None:
+            offsets: Dict[str, int] = {}
+            if self.index_path.exists():
+                with self.index_path.open("rb", buffering=IO_BUFFER_SIZE) as index:
+                    for line in index:
+                        run_id, _, offset = line.rstrip(b"\n").partition(b"\t")
+                        if offset.isdigit():
+                            offsets[run_id.decode("utf-8")] = int(offset)
+            self._offsets = offsets
+        return self._offsets
+
+    def _patch_status(self, run_id: str, status: str) -> bool:
+        """Overwrite the padded status of one line; False if that is not possible."""
+        padded = f"{status:<{STATUS_WIDTH}}".encode("utf-8")
+        offset = self._load_offsets().get(run_id)
+        if offset is None or len(padded) != STATUS_WIDTH:
+            return False
+        with self.history_path.open("r+b") as handle:
+            handle.seek(offset)
+            line = handle.readline()
+            match = _STATUS_VALUE.search(line)
+            if match is None or len(match.group(1)) != STATUS_WIDTH:
+                return False
+            try:
+                if orjson.loads(line)["run_id"] != run_id:
+                    return False
+            except (ValueError, KeyError):
+                return False
+            handle.seek(offset + match.start(1))
+            handle.write(padded)
+        return True
+
+    def _rewrite(self) -> None:
+        """Rewrite the whole log and rebuild the sidecar index."""
+        offsets: Dict[str, int] = {}
+        with self.history_path.open("wb", buffering=IO_BUFFER_SIZE) as handle:
+            for record in self._by_id.values():
+                offsets[record.run_id] = handle.tell()
+                handle.write(record.to_json())
+        with self.index_path.open("wb", buffering=IO_BUFFER_SIZE) as index:
+            for run_id, offset in offsets.items():
+                index.write(f"{run_id}\t{offset}\n".encode("utf-8"))
+        self._offsets = offsets
+
+
+_stores: Dict[Path, HistoryStore] = {}
+
+
+def get_store(history_path: Path) -> HistoryStore:
+    """Provide the process-wide store for a history file."""
+    store = _stores.get(history_path)
+    if store is None:
+        store = _stores[history_path] = HistoryStore(history_path)
+    return store
 
 
 def append_record(history_path: Path, record: HistoryRecord) -> None:
-    history_path.parent.mkdir(parents=True, exist_ok=True)
-    with history_path.open("a", encoding="utf-8") as handle:
-        handle.write(record.to_json())
-        handle.write("\n")
+    get_store(history_path).append(record)
 
 
 def load_history(history_path: Path) -> List[HistoryRecord]:
-    if not history_path.exists():
-        return []
-    records: List[HistoryRecord] = []
-    with history_path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                records.append(HistoryRecord.from_dict(json.loads(line)))
-            except json.JSONDecodeError:  # pragma: no cover - defensive
-                continue
-    return records
+    return get_store(history_path).records()
 
 
 def find_record(history_path: Path, run_id: str) -> HistoryRecord:
-    for record in load_history(history_path):
-        if record.run_id == run_id:
-            return record
-    raise ManifestError(f"Run id not found in history: {run_id}")
+    return get_store(history_path).find(run_id)
 
 
 def update_status(history_path: Path, run_id: str, status: str) -> None:
-    records = load_history(history_path)
-    updated = False
-    with history_path.open("w", encoding="utf-8") as handle:
-        for record in records:
-            if record.run_id == run_id:
-                record.status = status
-                updated = True
-            handle.write(record.to_json())
-            handle.write("\n")
-    if not updated:
-        raise ManifestError(f"Run id not found in history: {run_id}")
+    get_store(history_path).update_status(run_id, status)
 
 
 def create_record(
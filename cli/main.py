@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import os
-import shlex
 import shutil
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional
 
-import psycopg
+import orjson
 import typer
 
-from scripts.inject_enterprise_code import inject as inject_enterprise_code
-from scripts.wait_for_odoo import WaitConfig, wait_for_http, wait_for_postgres
-
-from .docker_ops import DockerRunner
+from .docker_ops import (
+    DockerRunner,
+    compose_version,
+    decode_output,
+    defines_healthchecks,
+    docker_client,
+)
 from .exceptions import (
     DockerError,
     EnterpriseError,
@@ -25,7 +30,7 @@ from .exceptions import (
     SeedError,
     ValidationError,
 )
-from .history import append_record, create_record, find_record, load_history, update_status
+from .history import create_record, get_store
 from .logger import get_console
 from .manifest import EditionVersionConfig, Manifest, load_manifest
 from .template_renderer import render_template
@@ -37,14 +42,20 @@ from .utils import (
     random_db_name,
 )
 
+if TYPE_CHECKING:  # psycopg and the scripts helpers are imported where they are used.
+    import psycopg
+
 console = get_console()
 app = typer.Typer(help="Manage disposable Odoo environments for testing.")
 
 DEFAULT_CONFIG_PATH = Path("~/.odoo-launch/config.yml")
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_MANIFEST_PATH = REPO_ROOT / "config" / "default_manifest.yml"
+# Filesystem probes and removals are syscall-bound and release the GIL.
+IO_WORKERS = 32
 
 
+@functools.lru_cache(maxsize=None)
 def _resolve_config_path(path: Optional[Path]) -> Path:
     if path is None:
         candidate = expand_path(str(DEFAULT_CONFIG_PATH))
@@ -60,32 +71,23 @@ def _load_manifest(config: Optional[Path]) -> Manifest:
     return load_manifest(path)
 
 
+class SourceMount(NamedTuple):
+    host: str
+    target: str
+    read_only: bool
+
+
 def _prepare_source_mounts(
     entry: EditionVersionConfig,
-) -> tuple[list[dict[str, object]], list[str]]:
-    mounts: list[dict[str, object]] = []
-    addon_targets: list[str] = []
-    for idx, addon_path in enumerate(entry.addons):
-        target = f"/mnt/extra-addons/addons_{idx:02d}"
-        mounts.append(
-            {
-                "host": str(addon_path),
-                "target": target,
-                "read_only": True,
-            }
-        )
-        addon_targets.append(target)
-    for idx, addon_path in enumerate(entry.extra_addons):
-        target = f"/mnt/extra-addons/custom_{idx:02d}"
-        mounts.append(
-            {
-                "host": str(addon_path),
-                "target": target,
-                "read_only": False,
-            }
-        )
-        addon_targets.append(target)
-    return mounts, addon_targets
+) -> tuple[list[SourceMount], list[str]]:
+    mounts = [
+        SourceMount(str(path), f"/mnt/extra-addons/addons_{idx:02d}", True)
+        for idx, path in enumerate(entry.addons)
+    ] + [
+        SourceMount(str(path), f"/mnt/extra-addons/custom_{idx:02d}", False)
+        for idx, path in enumerate(entry.extra_addons)
+    ]
+    return mounts, [mount.target for mount in mounts]
 
 
 def _render_compose(
@@ -118,46 +120,80 @@ def _render_compose(
         "source_mounts": source_mounts,
         "enterprise_code": enterprise_code,
         "addons_path": addons_path,
+        "readiness": manifest.defaults.readiness,
     }
     render_template(entry.compose_template, context, compose_file)
     return compose_file
 
 
-def _apply_sql_seed(
-    host: str,
-    port: int,
-    user: str,
-    password: str,
-    db_name: str,
-    sql_path: Path,
-) -> None:
-    sql_text = sql_path.read_text(encoding="utf-8")
-    with psycopg.connect(  # type: ignore[arg-type]
-        host=host,
-        port=port,
-        user=user,
-        password=password,
-        dbname=db_name,
-    ) as conn:
+SEED_READ_BUFFER = 1 << 17
+
+
+def _read_seed_file(path: Path) -> bytes:
+    with path.open("rb", buffering=SEED_READ_BUFFER) as handle:
+        return handle.read()
+
+
+def _apply_sql_seeds(conn: psycopg.Connection, sql_paths: List[Path]) -> None:
+    """Send every seed file to the server as one multi-statement query."""
+    import psycopg
+
+    # The separator starts on its own line so a trailing ``-- comment`` cannot swallow it.
+    sql_bytes = b"\n;\n".join(_read_seed_file(sql_path) for sql_path in sql_paths)
+    try:
         with conn.cursor() as cur:
-            cur.execute(sql_text)
-        conn.commit()
+            cur.execute(sql_bytes)
+    except psycopg.Error as exc:
+        files = ", ".join(str(sql_path) for sql_path in sql_paths)
+        raise SeedError(f"SQL seed batch failed ({files}): {exc}") from exc
+
+
+def _seed_script_payload(scripts: List[Path]) -> str:
+    """Join seed scripts into one ``odoo shell`` program.
+
+    Each script is compiled under its own file name so a traceback points at the
+    script that failed. As with one exec per script, the first failure stops the
+    scripts after it.
+    """
+    return "\n".join(
+        f"exec(compile({script.read_text(encoding='utf-8')!r}, {str(script)!r}, 'exec'))"
+        for script in scripts
+    )
+
+
+# Only these steps can be replayed on the same path once permissions are relaxed.
+_RETRYABLE_REMOVALS = (os.unlink, os.rmdir, os.remove)
+
+
+def _fix_and_retry(func: Callable[..., object], target: str, _exc: object) -> None:
+    """rmtree error hook: relax permissions on the entry and its parent, then retry once."""
+    for candidate in (os.path.dirname(target), target):
+        with suppress(OSError):
+            os.chmod(candidate, 0o777)
+    if func in _RETRYABLE_REMOVALS:
+        with suppress(OSError):
+            func(target)
+    elif (
+        os.path.isdir(target)
+        and not os.path.islink(target)
+        and os.access(target, os.R_OK | os.W_OK | os.X_OK)
+    ):
+        # The directory could not be opened or listed; it is readable now, so descend into it.
+        _rmtree_relaxed(target)
+
+
+def _rmtree_relaxed(path: str | Path) -> None:
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_fix_and_retry)
+    else:
+        shutil.rmtree(path, onerror=_fix_and_retry)
 
 
 def _force_remove(path: Path) -> None:
     """Best-effort removal of run artifacts with relaxed permissions."""
     if not path.exists():
         return
-    for sub_path in sorted(path.rglob("*"), reverse=True):
-        try:
-            sub_path.chmod(0o777)
-        except PermissionError:
-            pass
-    try:
-        path.chmod(0o777)
-    except PermissionError:
-        pass
-    shutil.rmtree(path, ignore_errors=True)
+    _rmtree_relaxed(path)
 
 
 def _run_seed_suite(
@@ -176,15 +212,25 @@ def _run_seed_suite(
     except KeyError as exc:
         raise SeedError(f"Unknown seed '{seed_name}' for {entry.edition} {entry.version}") from exc
 
-    for sql_file in seed_cfg.sql_files:
-        _apply_sql_seed(host, port, user, password, db_name, sql_file)
-    for script in seed_cfg.scripts:
-        payload = script.read_text(encoding="utf-8")
+    if seed_cfg.sql_files:
+        import psycopg
+
+        with psycopg.connect(  # type: ignore[arg-type]
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            dbname=db_name,
+        ) as conn:
+            _apply_sql_seeds(conn, seed_cfg.sql_files)
+            conn.commit()
+    if seed_cfg.scripts:
+        # One odoo shell session for all scripts avoids paying the exec cost per file.
         docker.exec(
             compose_file,
             "odoo",
             ["odoo", "shell", "-d", db_name, "--no-http"],
-            input_data=payload,
+            input_data=_seed_script_payload(seed_cfg.scripts),
         )
 
 
@@ -202,7 +248,9 @@ def _run_tests(
         command.extend(["--test-tags", test_tags])
     result = docker.exec(compose_file, "odoo", command, check=False)
     if result.returncode != 0:
-        raise LauncherError(f"Odoo tests failed:\n{result.stdout}\n{result.stderr}")
+        raise LauncherError(
+            f"Odoo tests failed:\n{decode_output(result.stdout)}\n{decode_output(result.stderr)}"
+        )
 
 
 def _enterprise_code_from_env(explicit: Optional[str]) -> Optional[str]:
@@ -224,6 +272,8 @@ def _handle_enterprise(
                 "Enterprise edition selected but no licence code provided. "
                 "Set ODOO_ENTERPRISE_CODE or pass --enterprise-code."
             )
+        from scripts.inject_enterprise_code import inject as inject_enterprise_code
+
         inject_enterprise_code(
             host=host,
             port=port,
@@ -256,6 +306,9 @@ def init(
         console.print(f"[warning]Config already exists at {destination}, use --force to overwrite.[/warning]")
         raise typer.Exit(code=1)
     destination.write_text(DEFAULT_MANIFEST_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    # A new config may now exist where the cached lookups fell back to the default.
+    _resolve_config_path.cache_clear()
+    expand_path.cache_clear()
     console.print(f"[success]Manifest written to {destination}[/success]")
 
 
@@ -276,9 +329,10 @@ def _execute_up(
     run_id = generate_run_id()
     db_name = random_db_name(prefix=f"{edition}_{version.replace('.', '_')}")
 
-    http_port = ensure_available_port(entry.http_port)
-    longpoll_port = ensure_available_port(entry.longpoll_port)
-    pg_port = ensure_available_port(entry.pg_port)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        http_port, longpoll_port, pg_port = executor.map(
+            ensure_available_port, [entry.http_port, entry.longpoll_port, entry.pg_port]
+        )
 
     run_root = ensure_directory(manifest.defaults.temp_run_root / run_id)
     enterprise_payload = _enterprise_code_from_env(enterprise_code)
@@ -296,7 +350,7 @@ def _execute_up(
         enterprise_code=enterprise_payload,
     )
 
-    docker = DockerRunner(manifest.defaults.compose_bin)
+    docker = DockerRunner(manifest.defaults.compose_bin_argv)
 
     record = create_record(
         run_id=run_id,
@@ -312,28 +366,40 @@ def _execute_up(
         keep_alive=keep_alive,
         status="starting",
     )
-    append_record(manifest.defaults.history_log, record)
+    history = get_store(manifest.defaults.history_log)
+    history.append(record)
     record_logged = True
 
     try:
         console.print(f"[info]Starting run {run_id} ({edition} {version})[/info]")
-        docker.up(compose_file)
-
-        wait_cfg = WaitConfig(
-            pg_host="127.0.0.1",
-            pg_port=pg_port,
-            pg_user="odoo",
-            pg_password="odoo",
-            db_name=db_name,
-            http_url=f"http://127.0.0.1:{http_port}/web/login",
-            pg_timeout=manifest.defaults.readiness.pg_timeout,
-            pg_interval=manifest.defaults.readiness.pg_interval,
-            http_timeout=manifest.defaults.readiness.http_timeout,
-            http_interval=manifest.defaults.readiness.http_interval,
-        )
+        readiness = manifest.defaults.readiness
+        if docker.supports_wait() and defines_healthchecks(compose_file, ("db", "odoo")):
+            # Compose blocks until the template healthchecks pass; no host-side polling.
+            # Templates without them fall back to the probes below.
+            docker.up(
+                compose_file,
+                wait=True,
+                wait_timeout=readiness.pg_timeout + readiness.http_timeout,
+            )
+        else:
+            from scripts.wait_for_odoo import WaitConfig, wait_concurrently
+
+            docker.up(compose_file)
+
+            wait_cfg = WaitConfig(
+                pg_host="127.0.0.1",
+                pg_port=pg_port,
+                pg_user="odoo",
+                pg_password="odoo",
+                db_name=db_name,
+                http_url=f"http://127.0.0.1:{http_port}/web/login",
+                pg_timeout=readiness.pg_timeout,
+                pg_interval=readiness.pg_interval,
+                http_timeout=readiness.http_timeout,
+                http_interval=readiness.http_interval,
+            )
 
-        wait_for_postgres(wait_cfg)
-        wait_for_http(wait_cfg)
+            wait_concurrently(wait_cfg)
         seed_to_use = seed or entry.default_seed
         _run_seed_suite(
             entry,
@@ -366,7 +432,12 @@ def _execute_up(
         record.status = new_status
 
         run_metadata_path = run_root / "run.json"
-        run_metadata_path.write_text(json.dumps(record.__dict__, indent=2, default=str), encoding="utf-8")
+        metadata = orjson.dumps(record, default=str, option=orjson.OPT_INDENT_2)
+        fd = os.open(run_metadata_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, metadata)
+        finally:
+            os.close(fd)
 
         _print_run_summary(run_metadata_path, http_port, db_name)
 
@@ -377,11 +448,11 @@ def _execute_up(
         else:
             console.print(f"[info]Run {run_id} will remain active until stopped[/info]")
 
-        update_status(manifest.defaults.history_log, run_id, new_status)
+        history.update_status(run_id, new_status)
     except Exception as exc:  # pragma: no cover - top-level guard
         docker.down(compose_file)
         if record_logged:
-            update_status(manifest.defaults.history_log, run_id, "failed")
+            history.update_status(run_id, "failed")
         _force_remove(run_root)
         raise exc
 
@@ -459,11 +530,12 @@ def stop(
 ) -> None:
     """Stop a running environment."""
     manifest = _load_manifest(config)
-    record = find_record(manifest.defaults.history_log, run_id)
-    docker = DockerRunner(manifest.defaults.compose_bin)
+    history = get_store(manifest.defaults.history_log)
+    record = history.find(run_id)
+    docker = DockerRunner(manifest.defaults.compose_bin_argv)
     docker.down(record.compose_file)
     _force_remove(record.run_root)
-    update_status(manifest.defaults.history_log, run_id, "stopped")
+    history.update_status(run_id, "stopped")
     console.print(f"[success]Stopped run {run_id}[/success]")
 
 
@@ -473,18 +545,33 @@ def clean(
 ) -> None:
     """Remove stale run directories and prune Docker artefacts."""
     manifest = _load_manifest(config)
-    records = load_history(manifest.defaults.history_log)
+    records = get_store(manifest.defaults.history_log).records()
     active_ids = {rec.run_id for rec in records if rec.status == "running"}
-    for path in manifest.defaults.temp_run_root.glob("odoo-*"):
-        if path.is_dir() and path.name not in active_ids:
-            shutil.rmtree(path, ignore_errors=True)
+    stale = [
+        path
+        for path in manifest.defaults.temp_run_root.glob("odoo-*")
+        if path.is_dir() and path.name not in active_ids
+    ]
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(stale))) as executor:
+            for path in stale:
+                executor.submit(shutil.rmtree, path, ignore_errors=True)
+        for path in stale:
             console.print(f"[info]Removed stale run directory {path}[/info]")
     console.print("[info]Pruning dangling Docker resources[/info]")
     try:
-        subprocess.run(  # noqa: S603,S607 - intentional Docker invocation
-            ["docker", "system", "prune", "--force", "--volumes"],
-            check=False,
-        )
+        client = docker_client()
+        if client is not None:
+            client.containers.prune()
+            client.networks.prune()
+            client.images.prune()
+            client.volumes.prune()
+            client.api.prune_builds()
+        else:
+            subprocess.run(  # noqa: S603,S607 - intentional Docker invocation
+                ["docker", "system", "prune", "--force", "--volumes"],
+                check=False,
+            )
     except Exception:  # pragma: no cover - defensive
         console.print("[warning]docker system prune failed (ignored)[/warning]")
 
@@ -495,25 +582,38 @@ def _check_command(command: list[str]) -> tuple[bool, str]:
             command,
             check=True,
             capture_output=True,
-            text=True,
         )
-        return True, result.stdout.strip() or "OK"
+        return True, decode_output(result.stdout).strip() or "OK"
     except FileNotFoundError:
         return False, "command not found"
     except subprocess.CalledProcessError as exc:
-        message = exc.stderr.strip() or exc.stdout.strip() or str(exc)
+        message = (
+            decode_output(exc.stderr).strip() or decode_output(exc.stdout).strip() or str(exc)
+        )
         return False, message
 
 
+def _docker_server_version() -> tuple[bool, str]:
+    try:
+        client = docker_client()
+    except DockerError as err:
+        return False, str(err)
+    if client is None:
+        return _check_command(["docker", "info", "--format", "{{json .ServerVersion}}"])
+    try:
+        return True, str(client.version()["Version"])
+    except Exception as exc:  # docker.errors.DockerException; the SDK is imported lazily
+        return False, str(exc)
+
+
 def _validate_docker_tooling(manifest: Manifest, errors: list[str]) -> None:
-    ok, msg = _check_command(["docker", "info", "--format", "{{json .ServerVersion}}"])
+    ok, msg = _docker_server_version()
     if not ok:
         errors.append(f"Docker check failed: {msg}")
     else:
         console.print(f"[info]Docker detected (server {msg})[/info]")
 
-    compose_cmd = shlex.split(manifest.defaults.compose_bin) + ["version"]
-    ok, msg = _check_command(compose_cmd)
+    ok, msg = compose_version(manifest.defaults.compose_bin_argv)
     if not ok:
         errors.append(f"docker compose check failed: {msg}")
     else:
@@ -521,13 +621,21 @@ def _validate_docker_tooling(manifest: Manifest, errors: list[str]) -> None:
 
 
 def _validate_repo_paths(manifest: Manifest, errors: list[str]) -> None:
+    checks: list[tuple[str, Path]] = []
     for edition, payload in manifest.editions.items():
         for version, entry in payload.items():
-            if not entry.repo_path.exists():
-                errors.append(f"Repo path missing for {edition} {version}: {entry.repo_path}")
+            checks.append(
+                (f"Repo path missing for {edition} {version}: {entry.repo_path}", entry.repo_path)
+            )
             for addon_path in [*entry.addons, *entry.extra_addons]:
-                if not addon_path.exists():
-                    errors.append(f"Addon path missing: {addon_path}")
+                checks.append((f"Addon path missing: {addon_path}", addon_path))
+    if not checks:
+        return
+    with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(checks))) as executor:
+        results = executor.map(Path.exists, [path for _, path in checks])
+        errors.extend(
+            message for (message, _), exists in zip(checks, results, strict=True) if not exists
+        )
 
 
 @app.command()
@@ -565,23 +673,23 @@ def psql(
 ) -> None:
     """Execute read-only SQL commands against a running environment."""
     manifest = _load_manifest(config)
-    record = find_record(manifest.defaults.history_log, run_id)
+    record = get_store(manifest.defaults.history_log).find(run_id)
     if command is None:
         console.print(
             "[warning]Interactive psql is not supported in this environment. "
             "Provide --command SQL to execute a statement."
         )
         raise typer.Exit(code=1)
-    docker = DockerRunner(manifest.defaults.compose_bin)
+    docker = DockerRunner(manifest.defaults.compose_bin_argv)
     result = docker.exec(
         record.compose_file,
         "db",
         ["psql", "-U", "odoo", "-d", record.db_name, "-c", command],
         check=False,
     )
-    console.print(result.stdout)
+    console.print(decode_output(result.stdout))
     if result.returncode != 0:
-        console.print(f"[error]{result.stderr}[/error]")
+        console.print(f"[error]{decode_output(result.stderr)}[/error]")
         raise typer.Exit(code=result.returncode)
 
 
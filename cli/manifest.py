@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import os
+import shlex
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import orjson
 import yaml
 
+try:  # libyaml's C parser when available; the pure-Python loader is far slower.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from .exceptions import ManifestError
 from .utils import ensure_directory, expand_path
 
+PARALLEL_STAT_THRESHOLD = 8
+MANIFEST_CACHE_DIR = Path("~/.odoo-launch/cache")
+STAT_WORKERS = 16
+
 
 @dataclass(frozen=True)
 class ReadinessConfig:
@@ -30,6 +46,11 @@ class Defaults:
     timezone: str
     readiness: ReadinessConfig
 
+    @functools.cached_property
+    def compose_bin_argv(self) -> tuple[str, ...]:
+        """``compose_bin`` split into argv form, computed once per manifest."""
+        return tuple(shlex.split(self.compose_bin))
+
 
 @dataclass(frozen=True)
 class SeedConfig:
@@ -69,12 +90,34 @@ class Manifest:
 
 
 def load_manifest(path: Path) -> Manifest:
-    """Load manifest YAML and normalise paths."""
-    if not path.exists():
-        raise ManifestError(f"Manifest not found: {path}")
+    """Load manifest YAML and normalise paths.
+
+    Parsed manifests are cached per resolved path, mtime and size, so repeated
+    loads in one process are free until the file changes.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise ManifestError(f"Manifest not found: {path}") from exc
+
+    manifest = _load_manifest_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-    with path.open("r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle)
+    ensure_directory(manifest.defaults.temp_run_root)
+    ensure_directory(manifest.defaults.history_log.parent)
+
+    return manifest
+
+
+@functools.lru_cache(maxsize=8)
+def _load_manifest_cached(path_str: str, mtime_ns: int, size: int) -> Manifest:
+    path = Path(path_str)
+    source = {"path": path_str, "mtime_ns": mtime_ns, "size": size}
+    cache_path = _manifest_cache_path(path_str)
+    raw = _read_manifest_cache(cache_path, source)
+    if raw is None:
+        with path.open("r", encoding="utf-8") as handle:
+            raw = yaml.load(handle, Loader=_YamlLoader)  # noqa: S506 - safe loader
+        _write_manifest_cache(cache_path, source, raw)
 
     try:
         defaults = _parse_defaults(raw.get("defaults", {}))
@@ -82,12 +125,52 @@ def load_manifest(path: Path) -> Manifest:
     except KeyError as exc:  # pragma: no cover - defensive
         raise ManifestError(f"Manifest missing required section: {exc}") from exc
 
-    ensure_directory(defaults.temp_run_root)
-    ensure_directory(defaults.history_log.parent)
-
     return Manifest(defaults=defaults, editions=editions)
 
 
+def _manifest_cache_path(path_str: str) -> Path:
+    digest = hashlib.sha1(path_str.encode("utf-8"), usedforsecurity=False).hexdigest()
+    return expand_path(str(MANIFEST_CACHE_DIR)) / f"{digest}.json"
+
+
+def _read_cache_file(cache_path: Path) -> Optional[dict]:
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _read_manifest_cache(cache_path: Path, source: dict) -> Optional[dict]:
+    """Return the JSON-cached manifest if it was built from this exact YAML file."""
+    cached = _read_cache_file(cache_path)
+    if cached is None or cached.get("source") != source:
+        return None
+    return cached.get("manifest")
+
+
+def _write_manifest_cache(cache_path: Path, source: dict, raw: object) -> None:
+    """Cache parsed YAML as JSON; skipped when JSON cannot represent it exactly."""
+    try:
+        payload = orjson.dumps({"source": source, "manifest": raw})
+    except TypeError:  # e.g. dates or non-string keys
+        return
+    if orjson.loads(payload)["manifest"] != raw:
+        return
+    if cache_path.exists():
+        existing = _read_cache_file(cache_path)
+        if existing is None or "source" not in existing:
+            return  # not one of ours; leave it alone.
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:  # unwritable home directory; the YAML still works.
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
 def _parse_defaults(data: dict) -> Defaults:
     try:
         readiness_data = data["readiness"]
@@ -121,27 +204,19 @@ def _parse_editions(
         editions[edition_name] = {}
         for version, payload in versions.items():
             repo_path = _resolve_relative(payload["repo_path"], base_dir)
-            if not repo_path.exists():
-                raise ManifestError(f"Configured repo path missing: {repo_path}")
-
             compose_template = _resolve_relative(payload["compose_template"], base_dir)
-            if not compose_template.exists():
-                raise ManifestError(f"Compose template missing: {compose_template}")
+            repo_root = str(repo_path)
 
             addons = [
-                _normalise_path(path_candidate, repo_path)
+                _normalise_path(path_candidate, repo_root)
                 for path_candidate in payload.get("addons", [])
             ]
             extra_addons = [
-                _normalise_path(path_candidate, repo_path)
+                _normalise_path(path_candidate, repo_root)
                 for path_candidate in payload.get("extra_addons", [])
             ]
 
-            for path in [*addons, *extra_addons]:
-                if not path.exists():
-                    raise ManifestError(f"Addon path missing: {path}")
-
-            seeds = _parse_seeds(payload.get("seeds", {}), repo_path)
+            seeds = _parse_seeds(payload.get("seeds", {}), repo_root)
             requires_enterprise = payload.get("requires_enterprise_code", False)
 
             editions[edition_name][version] = EditionVersionConfig(
@@ -159,26 +234,52 @@ def _parse_editions(
                 requires_enterprise_code=requires_enterprise,
                 seeds=seeds,
             )
+    _check_edition_paths(editions)
     return editions
 
 
-def _parse_seeds(seeds: dict, repo_path: Path) -> Dict[str, SeedConfig]:
+def _check_edition_paths(editions: Dict[str, Dict[str, EditionVersionConfig]]) -> None:
+    entries = [entry for versions in editions.values() for entry in versions.values()]
+    # Editions often share addon roots; stat each distinct path once, in parallel when
+    # there are enough of them to matter on slow or network filesystems.
+    paths = list(
+        dict.fromkeys(
+            path
+            for entry in entries
+            for path in (entry.repo_path, entry.compose_template, *entry.addons, *entry.extra_addons)
+        )
+    )
+    if len(paths) < PARALLEL_STAT_THRESHOLD:
+        existing = {path: path.exists() for path in paths}
+    else:
+        with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+            existing = dict(zip(paths, executor.map(Path.exists, paths), strict=True))
+
+    for entry in entries:
+        if not existing[entry.repo_path]:
+            raise ManifestError(f"Configured repo path missing: {entry.repo_path}")
+        if not existing[entry.compose_template]:
+            raise ManifestError(f"Compose template missing: {entry.compose_template}")
+        for path in [*entry.addons, *entry.extra_addons]:
+            if not existing[path]:
+                raise ManifestError(f"Addon path missing: {path}")
+
+
+def _parse_seeds(seeds: dict, repo_root: str) -> Dict[str, SeedConfig]:
     parsed: Dict[str, SeedConfig] = {}
     for name, payload in seeds.items():
         sql_files = [
-            _normalise_path(candidate, repo_path) for candidate in payload.get("sql", [])
+            _normalise_path(candidate, repo_root) for candidate in payload.get("sql", [])
         ]
         scripts = [
-            _normalise_path(candidate, repo_path) for candidate in payload.get("scripts", [])
+            _normalise_path(candidate, repo_root) for candidate in payload.get("scripts", [])
         ]
         parsed[name] = SeedConfig(name=name, sql_files=sql_files, scripts=scripts)
     return parsed
 
 
-def _normalise_path(candidate: str, repo_path: Path) -> Path:
-    if "{{ repo_path }}" in candidate:
-        candidate = candidate.replace("{{ repo_path }}", str(repo_path))
-    return expand_path(candidate)
+def _normalise_path(candidate: str, repo_root: str) -> Path:
+    return expand_path(candidate.replace("{{ repo_path }}", repo_root))
 
 
 def _resolve_relative(candidate: str, base_dir: Path) -> Path:
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 
 
-def render_template(source: Path, context: dict[str, Any], destination: Path) -> None:
-    env = Environment(
-        loader=FileSystemLoader(str(source.parent)),
+@functools.lru_cache(maxsize=32)
+def _get_env(parent: str) -> Environment:
+    """Environment per template directory; it keeps compiled templates in its own cache."""
+    return Environment(
+        loader=FileSystemLoader(parent),
         undefined=StrictUndefined,
         autoescape=False,
         keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=32,
     )
-    template = env.get_template(source.name)
+
+
+def render_template(source: Path, context: dict[str, Any], destination: Path) -> None:
+    template = _get_env(str(source.parent)).get_template(source.name)
     rendered = template.render(**context)
     destination.write_text(rendered, encoding="utf-8")
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import copy
 import json
-from datetime import datetime
+import time
 from typing import Any
 
-from odoo import _, fields, models
+from odoo import _, fields, models, tools
 
 
 class OperatorSession(models.Model):
@@ -62,41 +63,49 @@ class OperatorSession(models.Model):
             "Use the Layout JSON field to preview or hand off a canvas definition."
         )
         now_iso = fields.Datetime.now()
+        now_str = fields.Datetime.to_string(now_iso)
+        no_prompt = _("(no prompt provided)")
+        # The layout does not depend on the record, so build and serialise it once.
+        layout_json = json.dumps(self._build_placeholder_layout(), indent=2)
         for record in self:
-            layout = record._build_placeholder_layout()
             record.write(
                 {
                     "response": template
                     % {
-                        "prompt": record.prompt or _("(no prompt provided)"),
-                        "date": fields.Datetime.to_string(now_iso),
+                        "prompt": record.prompt or no_prompt,
+                        "date": now_str,
                     },
-                    "layout_json": json.dumps(layout, indent=2),
+                    "layout_json": layout_json,
                     "state": "generated",
                     "last_run_at": now_iso,
                 }
             )
 
     def action_set_draft(self) -> None:
-        for record in self:
-            record.write(
-                {
-                    "state": "draft",
-                    "response": False,
-                    "layout_json": False,
-                    "last_run_at": False,
-                }
-            )
+        self.write(
+            {
+                "state": "draft",
+                "response": False,
+                "layout_json": False,
+                "last_run_at": False,
+            }
+        )
 
     def action_archive(self) -> None:
-        for record in self:
-            record.write({"state": "archived"})
+        self.write({"state": "archived"})
 
     def _build_placeholder_layout(self) -> dict[str, Any]:
-        recency = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        # The ormcache value is shared by every caller; never hand out its nested lists/dicts.
+        layout = copy.deepcopy(self._placeholder_layout_template())
+        layout["generated_at"] = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
+        return layout
+
+    @tools.ormcache("self.env.lang")
+    def _placeholder_layout_template(self) -> dict[str, Any]:
+        """Translated, time-independent part of the layout, built once per language."""
         return {
             "layout_type": "dashboard",
-            "generated_at": recency,
+            "generated_at": None,
             "cards": [
                 {
                     "title": _("Outstanding Actions"),
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import argparse
-from datetime import datetime, timezone
 
 import psycopg
 
 SQL_STATEMENTS = (
     "INSERT INTO ir_config_parameter (key, value, create_uid, write_uid, create_date, write_date) "
-    "VALUES (%s, %s, 1, 1, %s, %s) "
-    "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, write_date = EXCLUDED.write_date"
+    "VALUES (%s, %s, 1, 1, NOW(), NOW()) "
+    "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, write_date = NOW()"
 )
 
 
@@ -22,10 +21,9 @@ def inject(
     dbname: str,
     code: str,
 ) -> None:
-    timestamp = datetime.now(tz=timezone.utc)
     payloads = [
-        ("database.enterprise_code", code, timestamp, timestamp),
-        ("database.enterprise_privilege", "1", timestamp, timestamp),
+        ("database.enterprise_code", code),
+        ("database.enterprise_privilege", "1"),
     ]
     with psycopg.connect(  # type: ignore[arg-type]
         host=host,
@@ -35,8 +33,11 @@ def inject(
         dbname=dbname,
         connect_timeout=5,
     ) as conn:
-        with conn.cursor() as cur:
-            cur.executemany(SQL_STATEMENTS, payloads)
+        # Prepare on first use so the server parses the upsert once for both rows.
+        conn.prepare_threshold = 0
+        # Pipeline mode sends both upserts before reading any result: one round trip.
+        with conn.pipeline(), conn.cursor() as cur:
+            cur.executemany(SQL_STATEMENTS, payloads, returning=False)
         conn.commit()
 
 
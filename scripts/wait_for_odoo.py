@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import socket
+import threading
 import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass
 from typing import Optional
 
@@ -11,6 +15,22 @@ import httpx
 import psycopg
 import psycopg.errors
 
+# First retry delay; doubles after each failure up to the configured interval.
+INITIAL_BACKOFF = 0.05
+TCP_PROBE_TIMEOUT = 0.2
+
+
+class WaitCancelled(RuntimeError):
+    """Raised by a probe when another part of the readiness wait has already failed."""
+
+
+def _pause(delay: float, cancel: Optional[threading.Event]) -> None:
+    """Sleep between attempts, waking early (and raising) when ``cancel`` is set."""
+    if cancel is None:
+        time.sleep(delay)
+    elif cancel.wait(delay):
+        raise WaitCancelled("readiness wait cancelled")
+
 
 @dataclass
 class WaitConfig:
@@ -26,10 +46,35 @@ class WaitConfig:
     http_interval: float
 
 
-def wait_for_postgres(cfg: WaitConfig) -> None:
+def _wait_for_tcp(
+    host: str,
+    port: int,
+    deadline: float,
+    max_delay: float,
+    cancel: Optional[threading.Event] = None,
+) -> Optional[OSError]:
+    """Poll with bare TCP connects until the port accepts; return the last failure if not."""
+    last_error: Optional[OSError] = None
+    delay = min(INITIAL_BACKOFF, max_delay)
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=TCP_PROBE_TIMEOUT):
+                return None
+        except OSError as err:
+            last_error = err
+        _pause(delay, cancel)
+        delay = min(delay * 2, max_delay)
+    return last_error
+
+
+def wait_for_postgres(cfg: WaitConfig, cancel: Optional[threading.Event] = None) -> None:
     """Block until PostgreSQL accepts connections or timeout occurs."""
     deadline = time.monotonic() + cfg.pg_timeout
-    last_error: Optional[Exception] = None
+    # Cheap TCP probes first; the auth handshake below only runs once the port is open.
+    last_error: Optional[Exception] = _wait_for_tcp(
+        cfg.pg_host, cfg.pg_port, deadline, cfg.pg_interval, cancel
+    )
+    delay = min(INITIAL_BACKOFF, cfg.pg_interval)
     while time.monotonic() < deadline:
         try:
             with psycopg.connect(  # type: ignore[arg-type]
@@ -43,18 +88,26 @@ def wait_for_postgres(cfg: WaitConfig) -> None:
                 return
         except psycopg.OperationalError as err:
             last_error = err
-        time.sleep(cfg.pg_interval)
+        _pause(delay, cancel)
+        delay = min(delay * 2, cfg.pg_interval)
     raise TimeoutError(f"PostgreSQL readiness timed out: {last_error}")  # pragma: no cover
 
 
-def wait_for_http(cfg: WaitConfig) -> None:
+def wait_for_http(cfg: WaitConfig, cancel: Optional[threading.Event] = None) -> None:
     """Block until HTTP endpoint returns a healthy status."""
     deadline = time.monotonic() + cfg.http_timeout
     last_error: Optional[Exception] = None
-    with httpx.Client(timeout=cfg.http_interval, follow_redirects=True) as client:
+    delay = min(INITIAL_BACKOFF, cfg.http_interval)
+    with httpx.Client(
+        timeout=cfg.http_interval,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=1, keepalive_expiry=60),
+    ) as client:
         while time.monotonic() < deadline:
             try:
-                response = client.get(cfg.http_url)
+                # HEAD skips downloading the login page; any answer below 500
+                # (a 405 included) already proves the server is serving requests.
+                response = client.head(cfg.http_url)
                 if response.status_code < 500:
                     return
                 last_error = RuntimeError(
@@ -62,7 +115,8 @@ def wait_for_http(cfg: WaitConfig) -> None:
                 )
             except httpx.HTTPError as err:
                 last_error = err
-            time.sleep(cfg.http_interval)
+            _pause(delay, cancel)
+            delay = min(delay * 2, cfg.http_interval)
     raise TimeoutError(f"Odoo HTTP readiness timed out: {last_error}")  # pragma: no cover
 
 
@@ -71,6 +125,24 @@ def wait(cfg: WaitConfig) -> None:
     wait_for_http(cfg)
 
 
+def wait_concurrently(cfg: WaitConfig) -> None:
+    """Poll PostgreSQL and HTTP side by side; the first failure stops the other probe."""
+    cancel = threading.Event()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(wait_for_postgres, cfg, cancel),
+            executor.submit(wait_for_http, cfg, cancel),
+        ]
+        try:
+            done, _ = wait_futures(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                future.result()
+        finally:
+            # Also reached on Ctrl-C; without it leaving the executor joins a probe
+            # that may keep polling until its own timeout.
+            cancel.set()
+
+
 def _parse_args() -> WaitConfig:
     parser = argparse.ArgumentParser(description="Wait for Odoo readiness.")
     parser.add_argument("--pg-host", default="127.0.0.1")
@@ -16,7 +16,8 @@ def test_init_writes_manifest(tmp_path: Path) -> None:
             "--force",
         ],
         check=True,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
     assert config_path.exists()
@@ -6,7 +6,8 @@ def test_cli_help() -> None:
     result = subprocess.run(  # noqa: S603,S607
         [sys.executable, "-m", "cli.main", "--help"],
         check=True,
-        capture_output=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         text=True,
     )
     assert "Manage disposable Odoo environments" in result.stdout
@@ -0,0 +1,97 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+from cli import docker_ops
+from cli.docker_ops import DockerRunner, defines_healthchecks
+from cli.main import REPO_ROOT, SourceMount
+from cli.manifest import ReadinessConfig
+from cli.template_renderer import render_template
+
+
+def test_up_passes_wait_flags(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(cmd: list[str], **_: object) -> subprocess.CompletedProcess:
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(docker_ops.subprocess, "run", fake_run)
+    compose_file = tmp_path / "docker-compose.yml"
+    DockerRunner(("docker", "compose")).up(compose_file, wait=True, wait_timeout=720)
+    assert calls == [
+        ["docker", "compose", "-f", str(compose_file), "up", "-d", "--wait", "--wait-timeout", "720"]
+    ]
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [("2.29.1\n", True), ("v2.1.1", True), ("2.0.1", False), ("1.29.2", False), ("", False)],
+)
+def test_supports_wait_checks_compose_version(
+    monkeypatch: pytest.MonkeyPatch, output: str, expected: bool
+) -> None:
+    monkeypatch.setattr(docker_ops, "compose_version", lambda _argv: (True, output))
+    assert DockerRunner(("docker", "compose")).supports_wait() is expected
+
+
+def _render(template: Path, destination: Path) -> Path:
+    context = {
+        "postgres_image": "postgres:16",
+        "odoo_image": "odoo:18.0",
+        "run_id": "odoo-test",
+        "db_name": "db",
+        "db_user": "odoo",
+        "db_password": "odoo",
+        "http_port": 8069,
+        "longpoll_port": 8072,
+        "pg_port": 15432,
+        "run_root": str(destination.parent),
+        "source_mounts": [SourceMount("/src/addons", "/mnt/extra-addons/addons_00", True)],
+        "enterprise_code": None,
+        "addons_path": "/mnt/extra-addons/addons_00",
+        "readiness": ReadinessConfig(http_timeout=600, http_interval=5, pg_timeout=120, pg_interval=3),
+    }
+    render_template(template, context, destination)
+    return destination
+
+
+@pytest.mark.parametrize("edition", ["community", "enterprise"])
+def test_compose_templates_define_healthchecks(tmp_path: Path, edition: str) -> None:
+    compose_file = _render(
+        REPO_ROOT / "docker" / f"compose.{edition}.yml.j2", tmp_path / "docker-compose.yml"
+    )
+    services = yaml.safe_load(compose_file.read_text(encoding="utf-8"))["services"]
+
+    assert services["db"]["healthcheck"]["test"] == [
+        "CMD-SHELL",
+        "pg_isready -U odoo -d postgres",
+    ]
+    odoo_check = services["odoo"]["healthcheck"]
+    assert odoo_check["test"][:3] == ["CMD", "python3", "-c"]
+    assert "http://localhost:8069/web/login" in odoo_check["test"][3]
+    assert odoo_check["interval"] == "5s"
+    assert odoo_check["start_period"] == "600s"
+    assert defines_healthchecks(compose_file, ("db", "odoo"))
+
+
+def test_template_without_healthchecks_is_not_waited_on(tmp_path: Path) -> None:
+    source = (REPO_ROOT / "docker" / "compose.community.yml.j2").read_text(encoding="utf-8")
+    kept = []
+    skipping = False
+    for line in source.splitlines(keepends=True):
+        if line.strip() == "healthcheck:":
+            skipping = True
+            continue
+        if skipping and line.startswith("      "):
+            continue
+        skipping = False
+        kept.append(line)
+    template = tmp_path / "compose.custom.yml.j2"
+    template.write_text("".join(kept), encoding="utf-8")
+
+    compose_file = _render(template, tmp_path / "docker-compose.yml")
+    assert "healthcheck" not in compose_file.read_text(encoding="utf-8")
+    assert not defines_healthchecks(compose_file, ("db", "odoo"))
@@ -1,12 +1,19 @@
 from pathlib import Path
 
-from cli.history import append_record, create_record, load_history, update_status
+from cli.history import (
+    HistoryRecord,
+    HistoryStore,
+    append_record,
+    create_record,
+    find_record,
+    load_history,
+    update_status,
+)
 
 
-def test_history_roundtrip(tmp_path: Path) -> None:
-    history_file = tmp_path / "history.log"
-    record = create_record(
-        run_id="odoo-test",
+def _make_record(tmp_path: Path, run_id: str = "odoo-test") -> HistoryRecord:
+    return create_record(
+        run_id=run_id,
         edition="community",
         version="18.0",
         db_name="db",
@@ -19,6 +26,11 @@ def test_history_roundtrip(tmp_path: Path) -> None:
         keep_alive=False,
         status="starting",
     )
+
+
+def test_history_roundtrip(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.log"
+    record = _make_record(tmp_path)
     append_record(history_file, record)
     saved = load_history(history_file)
     assert saved[0].run_id == "odoo-test"
@@ -26,3 +38,61 @@ def test_history_roundtrip(tmp_path: Path) -> None:
     update_status(history_file, "odoo-test", "stopped")
     saved = load_history(history_file)
     assert saved[0].status == "stopped"
+
+
+def test_history_store_picks_up_external_changes(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.log"
+    store = HistoryStore(history_file)
+    store.append(_make_record(tmp_path, "odoo-a"))
+    assert store.find("odoo-a").status == "starting"
+
+    append_record(history_file, _make_record(tmp_path, "odoo-b"))
+    update_status(history_file, "odoo-a", "stopped")
+    assert store.find("odoo-a").status == "stopped"
+    assert find_record(history_file, "odoo-b").run_id == "odoo-b"
+
+
+def test_update_status_patches_line_in_place(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.log"
+    store = HistoryStore(history_file)
+    store.append(_make_record(tmp_path, "odoo-a"))
+    store.append(_make_record(tmp_path, "odoo-b"))
+    size_before = history_file.stat().st_size
+
+    store.update_status("odoo-a", "failed")
+    assert history_file.stat().st_size == size_before
+    assert [rec.status for rec in HistoryStore(history_file).records()] == ["failed", "starting"]
+
+
+def test_update_status_rewrites_without_index(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.log"
+    append_record(history_file, _make_record(tmp_path, "odoo-legacy"))
+    store = HistoryStore(history_file)
+    store.index_path.unlink()
+
+    store.update_status("odoo-legacy", "stopped")
+    assert store.index_path.exists()
+    assert HistoryStore(history_file).find("odoo-legacy").status == "stopped"
+
+
+def test_history_ignores_unknown_fields(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.log"
+    append_record(history_file, _make_record(tmp_path, "odoo-a"))
+    line = history_file.read_bytes().rstrip(b"\n")
+    history_file.write_bytes(line[:-1] + b', "note": "extra", "http_port": "8070"}\n')
+
+    record = HistoryStore(history_file).find("odoo-a")
+    assert record.http_port == 8070
+    assert record.status == "starting"
+
+
+def test_append_caches_a_copy_of_the_record(tmp_path: Path) -> None:
+    history_file = tmp_path / "history.log"
+    store = HistoryStore(history_file)
+    record = _make_record(tmp_path, "odoo-a")
+    store.append(record)
+    record.seed = "demo"
+    record.status = "running"
+
+    cached = store.find("odoo-a")
+    assert (cached.seed, cached.status) == ("basic", "starting")
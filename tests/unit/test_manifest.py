@@ -1,10 +1,67 @@
+from pathlib import Path
+
+import orjson
+import pytest
+
+from cli import manifest as manifest_module
+from cli.exceptions import ManifestError
 from cli.main import DEFAULT_MANIFEST_PATH
 from cli.manifest import load_manifest
 
 
+@pytest.fixture(autouse=True)
+def manifest_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(manifest_module, "MANIFEST_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 def test_default_manifest_loads() -> None:
     manifest = load_manifest(DEFAULT_MANIFEST_PATH)
     community = manifest.get_version("community", "18.0")
     assert community.repo_path.exists()
     assert community.compose_template.exists()
     assert community.http_port > 0
+
+
+def test_compose_bin_argv_is_split_once() -> None:
+    manifest = load_manifest(DEFAULT_MANIFEST_PATH)
+    argv = manifest.defaults.compose_bin_argv
+    assert argv == ("docker", "compose")
+    assert manifest.defaults.compose_bin_argv is argv
+
+
+def test_manifest_is_cached_until_file_changes() -> None:
+    assert load_manifest(DEFAULT_MANIFEST_PATH) is load_manifest(DEFAULT_MANIFEST_PATH)
+
+
+def test_missing_addon_path_is_reported(tmp_path: Path) -> None:
+    raw = DEFAULT_MANIFEST_PATH.read_text(encoding="utf-8")
+    manifest_path = tmp_path / "manifest.yml"
+    manifest_path.write_text(
+        raw.replace("../docker/", f"{DEFAULT_MANIFEST_PATH.parent.parent}/docker/").replace(
+            "{{ repo_path }}/addons", str(tmp_path / "missing-addons")
+        ),
+        encoding="utf-8",
+    )
+    with pytest.raises(ManifestError, match="Addon path missing"):
+        load_manifest(manifest_path)
+
+
+def test_manifest_json_cache_tracks_yaml_source(tmp_path: Path, manifest_cache_dir: Path) -> None:
+    raw = DEFAULT_MANIFEST_PATH.read_text(encoding="utf-8")
+    manifest_path = tmp_path / "manifest.yml"
+    manifest_path.write_text(
+        raw.replace("../docker/", f"{DEFAULT_MANIFEST_PATH.parent.parent}/docker/"),
+        encoding="utf-8",
+    )
+    user_json = tmp_path / "manifest.json"
+    user_json.write_text('{"mine": true}', encoding="utf-8")
+
+    load_manifest(manifest_path)
+
+    assert user_json.read_text(encoding="utf-8") == '{"mine": true}'
+    (cache_file,) = manifest_cache_dir.glob("*.json")
+    cached = orjson.loads(cache_file.read_bytes())
+    assert cached["source"]["size"] == manifest_path.stat().st_size
+    assert cached["manifest"]["editions"]["community"]["18.0"]["http_port"] == 8069
@@ -0,0 +1,87 @@
+import re
+import traceback
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+
+import psycopg
+import pytest
+
+from cli.exceptions import SeedError
+from cli.main import _apply_sql_seeds, _seed_script_payload
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self.conn = conn
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, query: bytes) -> None:
+        if self.conn.error is not None:
+            raise self.conn.error
+        self.conn.executed.append(query)
+
+
+class _FakeConnection:
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.error = error
+        self.executed: list[bytes] = []
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+
+def _statements(sql: bytes) -> list[str]:
+    without_comments = re.sub(r"--[^\n]*", "", sql.decode("utf-8"))
+    return [part.strip() for part in without_comments.split(";") if part.strip()]
+
+
+def test_trailing_comment_does_not_swallow_separator(tmp_path: Path) -> None:
+    first = tmp_path / "01_users.sql"
+    first.write_bytes(b"INSERT INTO t VALUES (1) -- no semicolon, no newline")
+    second = tmp_path / "02_orders.sql"
+    second.write_bytes(b"INSERT INTO t VALUES (2);\n")
+    conn = _FakeConnection()
+
+    _apply_sql_seeds(conn, [first, second])  # type: ignore[arg-type]
+
+    (batch,) = conn.executed
+    assert _statements(batch) == ["INSERT INTO t VALUES (1)", "INSERT INTO t VALUES (2)"]
+
+
+def test_failing_sql_batch_names_its_files(tmp_path: Path) -> None:
+    paths = [tmp_path / "01_users.sql", tmp_path / "02_orders.sql"]
+    for path in paths:
+        path.write_bytes(b"SELECT 1;")
+    conn = _FakeConnection(error=psycopg.Error("syntax error at or near"))
+
+    with pytest.raises(SeedError) as excinfo:
+        _apply_sql_seeds(conn, paths)  # type: ignore[arg-type]
+    message = str(excinfo.value)
+    assert all(str(path) in message for path in paths)
+    assert "syntax error" in message
+
+
+def test_first_failing_script_stops_later_scripts(tmp_path: Path) -> None:
+    scripts = {
+        "a_partners.py": "env.calls.append('a')  # it's fine\n",
+        "b_broken.py": "env.calls.append('b')\nraise RuntimeError('seed failed')\n",
+        "c_orders.py": "env.calls.append('c')\n",
+    }
+    paths = []
+    for name, body in scripts.items():
+        path = tmp_path / name
+        path.write_text(body, encoding="utf-8")
+        paths.append(path)
+    env = SimpleNamespace(calls=[])
+
+    with pytest.raises(RuntimeError, match="seed failed") as excinfo:
+        exec(_seed_script_payload(paths), {"env": env})  # noqa: S102 - mimics odoo shell
+
+    assert env.calls == ["a", "b"]
+    assert str(tmp_path / "b_broken.py") in "".join(traceback.format_tb(excinfo.tb))
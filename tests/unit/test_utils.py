@@ -1,6 +1,10 @@
 import socket
+from pathlib import Path
+
+import pytest
 
 from cli import utils
+from cli.exceptions import ValidationError
 
 
 def test_generate_run_id_unique() -> None:
@@ -20,3 +24,21 @@ def test_ensure_available_port_skips_bound_port() -> None:
         assert chosen_port != bound_port
     finally:
         sock.close()
+
+
+def test_assert_ports_available_reports_listening_port() -> None:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(1)
+    bound_port = sock.getsockname()[1]
+    try:
+        with pytest.raises(ValidationError, match=str(bound_port)):
+            utils.assert_ports_available([bound_port])
+    finally:
+        sock.close()
+
+
+def test_expand_path_normalises_user_and_parent_segments() -> None:
+    home = Path.home()
+    assert utils.expand_path("~/odoo-launch") == home / "odoo-launch"
+    assert utils.expand_path("/opt/odoo/../launcher") == Path("/opt/launcher").resolve()
@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+
+from scripts import wait_for_odoo
+from scripts.wait_for_odoo import WaitCancelled, WaitConfig, wait_concurrently, wait_for_http
+
+
+def _config() -> WaitConfig:
+    return WaitConfig(
+        pg_host="127.0.0.1",
+        pg_port=1,
+        pg_user="odoo",
+        pg_password="odoo",
+        db_name="db",
+        http_url="http://127.0.0.1:1/web/login",
+        pg_timeout=30,
+        pg_interval=0.1,
+        http_timeout=30,
+        http_interval=0.1,
+    )
+
+
+def test_first_probe_failure_cancels_the_other(monkeypatch: pytest.MonkeyPatch) -> None:
+    http_cancelled = threading.Event()
+
+    def failing_postgres(cfg: WaitConfig, cancel: threading.Event) -> None:
+        time.sleep(0.05)
+        raise TimeoutError("PostgreSQL readiness timed out")
+
+    def slow_http(cfg: WaitConfig, cancel: threading.Event) -> None:
+        if cancel.wait(5):
+            http_cancelled.set()
+            raise WaitCancelled("readiness wait cancelled")
+
+    monkeypatch.setattr(wait_for_odoo, "wait_for_postgres", failing_postgres)
+    monkeypatch.setattr(wait_for_odoo, "wait_for_http", slow_http)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError, match="PostgreSQL"):
+        wait_concurrently(_config())
+    assert time.monotonic() - started < 2
+    assert http_cancelled.is_set()
+
+
+def test_wait_concurrently_returns_when_both_probes_pass(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(wait_for_odoo, "wait_for_postgres", lambda cfg, cancel: calls.append("pg"))
+    monkeypatch.setattr(wait_for_odoo, "wait_for_http", lambda cfg, cancel: calls.append("http"))
+
+    wait_concurrently(_config())
+    assert sorted(calls) == ["http", "pg"]
+
+
+def test_http_probe_stops_once_cancelled() -> None:
+    cancel = threading.Event()
+    cancel.set()
+    started = time.monotonic()
+    with pytest.raises(WaitCancelled):
+        wait_for_http(_config(), cancel)
+    assert time.monotonic() - started < 2